@@ -10,7 +10,7 @@
 #   - Python 3
 #   - 'requests' library (pip install requests)
 #   - 'python-dotenv' library (pip install python-dotenv)
-#   - The `strava_auth.py` script must be in the same directory
+#   - The `strava_auth.py` and `strava_formatters.py` scripts must be in the same directory
 #   - A `.env` file with Strava API credentials must be set up
 #
 # Setup:
@@ -29,229 +29,241 @@
 #
 
 import json
+import logging
 import os
 import requests
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, time
+from functools import lru_cache
 
-# Import the function from our authentication script
-from strava_auth import get_access_token
+# orjson serializes several times faster than the stdlib json module and
+# handles datetime objects natively; fall back to stdlib json if unavailable.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def parse_date_argument(date_str):
+# Import the functions from our authentication script
+from strava_auth import get_access_token, get_session
+# Shared formatting and persistence helpers
+from strava_formatters import (
+    activities_filepath,
+    build_run_outputs,
+    dump_jsonl_record,
+    format_hms,
+    prepare_workout_data,
+    save_activities_to_json,
+)
+
+# Shared HTTP session (owned by strava_auth) so all Strava calls — token
+# refresh included — reuse the same pooled keep-alive connections instead of
+# paying a TCP+TLS handshake per request.
+SESSION = get_session()
+SESSION.headers.update({'User-Agent': 'strava-fetcher/1.0'})
+
+# Number of parallel workers for per-activity detail fetches.
+MAX_WORKERS = 8
+
+# Folder for cached /activities/{id} responses. Activity details never change
+# once an upload has settled, so re-runs within the same week can skip the
+# API round-trip entirely.
+CACHE_DIR = os.path.join(".cache", "activities")
+
+def is_cache_worthy(activity_summary):
     """
-    Parses a date string in YYYY-MM-DD format.
-    
+    Checks whether an activity's detail response is safe to cache.
+
+    Activities can still be edited (name, gear, etc.) shortly after upload,
+    so only cache details for activities that started more than 24h ago.
+
     Args:
-        date_str (str): Date string in YYYY-MM-DD format
-        
+        activity_summary (dict): Activity summary data from Strava API
+
     Returns:
-        datetime: Parsed datetime object or None if invalid
+        bool: True if the detail response can be served from cache
+    """
+    start_date = activity_summary.get('start_date')
+    if not start_date:
+        return False
+    started = datetime.fromisoformat(start_date)
+    now = datetime.now(started.tzinfo) if started.tzinfo else datetime.now()
+    return now - started >= timedelta(hours=24)
+
+@lru_cache(maxsize=256)
+def _read_cached_detail(activity_id):
+    """
+    Reads and decodes one cached activity detail from disk.
+
+    Raises on a missing or corrupt file so lru_cache only memoizes
+    successful loads; a miss stays uncached and is retried once the file
+    exists.
+
+    Args:
+        activity_id (int): Strava activity ID
+
+    Returns:
+        dict: Cached detailed activity data
+    """
+    cache_path = os.path.join(CACHE_DIR, f"{activity_id}.json")
+    with open(cache_path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def load_cached_detail(activity_id):
+    """
+    Loads a cached activity detail, if present.
+
+    The lru_cache on the disk reader acts as an in-process L1 on top of the
+    on-disk cache, so repeated lookups within one process avoid the file
+    read too. Only hits are memoized: an activity cached later in the same
+    process is found on the next lookup instead of being re-fetched.
+
+    Args:
+        activity_id (int): Strava activity ID
+
+    Returns:
+        dict: Cached detailed activity data, or None on a cache miss
     """
     try:
-        return datetime.strptime(date_str, '%Y-%m-%d')
+        return _read_cached_detail(activity_id)
+    except FileNotFoundError:
+        return None
     except ValueError:
+        # Corrupt or truncated cache entry: treat it as a miss so the run
+        # falls back to the API and the fresh fetch overwrites the bad file
         return None
 
-def format_pace(seconds_per_meter):
+def write_cached_detail(activity_id, detailed_activity):
     """
-    Converts pace from seconds per meter to a MM:SS/km string.
-    
+    Writes an activity detail response to the on-disk cache.
+
     Args:
-        seconds_per_meter (float): Pace in seconds per meter
-        
-    Returns:
-        str: Formatted pace string (MM:SS)
+        activity_id (int): Strava activity ID
+        detailed_activity (dict): Detailed activity data from Strava API
     """
-    if seconds_per_meter is None or seconds_per_meter <= 0:
-        return "00:00"
-    
-    seconds_per_km = seconds_per_meter * 1000
-    minutes = int(seconds_per_km // 60)
-    seconds = int(seconds_per_km % 60)
-    return f"{minutes:02d}:{seconds:02d}"
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    cache_path = os.path.join(CACHE_DIR, f"{activity_id}.json")
+    # Write atomically via a temp file + os.replace so an interrupted run
+    # never leaves a truncated cache entry behind
+    tmp_path = f"{cache_path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        if orjson is not None:
+            f.write(orjson.dumps(detailed_activity))
+        else:
+            f.write(json.dumps(detailed_activity).encode('utf-8'))
+    os.replace(tmp_path, cache_path)
 
-def format_run_for_gemini(detailed_activity):
+def parse_json_response(response):
     """
-    Formats the run data into a clean Markdown string for AI analysis.
-    
+    Decodes the body of a Strava API response.
+
+    Uses orjson when available, which parses noticeably faster than the
+    stdlib json path taken by response.json().
+
     Args:
-        detailed_activity (dict): Detailed activity data from Strava API
-        
+        response (requests.Response): Response from the Strava API
+
     Returns:
-        str: Markdown-formatted activity summary
+        The decoded JSON payload
     """
-    # --- Build the Summary ---
-    summary_lines = ["### Activity Summary"]
-    distance_km = detailed_activity.get('distance', 0) / 1000.0
-    moving_time = timedelta(seconds=detailed_activity.get('moving_time', 0))
-    elapsed_time = timedelta(seconds=detailed_activity.get('elapsed_time', 0))
-    avg_speed = detailed_activity.get('average_speed', 0)
-    pace = format_pace(1 / avg_speed) if avg_speed > 0 else "00:00"
-    calories = detailed_activity.get('calories', 0)
-
-    summary_lines.append(f"- **Distance**: {distance_km:.2f} km")
-    summary_lines.append(f"- **Moving Time**: {moving_time}")
-    summary_lines.append(f"- **Average Pace**: {pace} /km")
-    summary_lines.append(f"- **Calories**: {int(calories)}")
-
-    # --- Build the Splits Table ---
-    splits = detailed_activity.get("splits_metric")
-    if splits:
-        summary_lines.append("\n### Splits Breakdown")
-        summary_lines.append("| Split | Pace (/km) | Distance (km) | Time    | Avg HR | Elev Diff (m) |")
-        summary_lines.append("|-------|------------|---------------|---------|--------|---------------|")
-        for split in splits:
-            split_num = split.get('split')
-            split_pace = format_pace(1 / split.get('average_speed', 0)) if split.get('average_speed') else "00:00"
-            split_dist_km = f"{split.get('distance', 0) / 1000.0:.2f}"
-            split_time = str(timedelta(seconds=split.get('moving_time', 0)))
-            split_hr = str(int(split.get('average_heartrate', 0))) if split.get('average_heartrate') else "N/A"
-            split_elev = f"{split.get('elevation_difference', 0):.1f}"
-            summary_lines.append(f"| {split_num:<5} | {split_pace:<10} | {split_dist_km:<13} | {split_time:<7} | {split_hr:<6} | {split_elev:<13} |")
-    
-    return "\n".join(summary_lines)
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
-def prepare_run_data(detailed_activity):
+def parse_date_argument(date_str):
     """
-    Prepares run data for JSON storage in a format similar to console output.
+    Parses a date string in YYYY-MM-DD format.
     
     Args:
-        detailed_activity (dict): Detailed activity data from Strava API
+        date_str (str): Date string in YYYY-MM-DD format
         
     Returns:
-        dict: Structured run data for JSON storage
+        datetime: Parsed datetime object or None if invalid
     """
-    activity_date = datetime.fromisoformat(detailed_activity.get('start_date')).strftime('%Y-%m-%d')
-    activity_id = detailed_activity.get('id')
-    activity_name = detailed_activity.get('name')
-    
-    # Summary data
-    distance_km = detailed_activity.get('distance', 0) / 1000.0
-    moving_time_str = str(timedelta(seconds=detailed_activity.get('moving_time', 0)))
-    elapsed_time_str = str(timedelta(seconds=detailed_activity.get('elapsed_time', 0)))
-    avg_speed = detailed_activity.get('average_speed', 0)
-    pace = format_pace(1 / avg_speed) if avg_speed > 0 else "00:00"
-    calories = int(detailed_activity.get('calories', 0))
-    
-    run_data = {
-        "activity_type": "Run",
-        "activity_id": activity_id,
-        "activity_name": activity_name,
-        "date": activity_date,
-        "summary": {
-            "distance_km": round(distance_km, 2),
-            "moving_time": moving_time_str,
-            "elapsed_time": elapsed_time_str,
-            "average_pace_per_km": pace,
-            "calories": calories
-        },
-        "splits": []
-    }
-    
-    # Splits data
-    splits = detailed_activity.get("splits_metric")
-    if splits:
-        for split in splits:
-            split_pace = format_pace(1 / split.get('average_speed', 0)) if split.get('average_speed') else "00:00"
-            split_dist_km = round(split.get('distance', 0) / 1000.0, 2)
-            split_time = str(timedelta(seconds=split.get('moving_time', 0)))
-            split_hr = int(split.get('average_heartrate', 0)) if split.get('average_heartrate') else None
-            split_elev = round(split.get('elevation_difference', 0), 1)
-            
-            run_data["splits"].append({
-                "split_number": split.get('split'),
-                "pace_per_km": split_pace,
-                "distance_km": split_dist_km,
-                "time": split_time,
-                "avg_heart_rate": split_hr,
-                "elevation_difference_m": split_elev
-            })
-    
-    return run_data
+    try:
+        return datetime.strptime(date_str, '%Y-%m-%d')
+    except ValueError:
+        return None
 
-def prepare_workout_data(activity_summary):
+def handle_run(activity_summary, detailed_by_id, all_activities_data):
     """
-    Prepares workout data for JSON storage.
-    
+    Processes a Run activity using its prefetched detail response.
+
     Args:
         activity_summary (dict): Activity summary data from Strava API
-        
-    Returns:
-        dict: Structured workout data for JSON storage
+        detailed_by_id (dict): Prefetched detail responses keyed by activity ID
+        all_activities_data (list): Accumulator for JSON-ready activity data
     """
-    activity_date = datetime.fromisoformat(activity_summary.get('start_date')).strftime('%Y-%m-%d')
-    activity_id = activity_summary.get('id')
     activity_name = activity_summary.get('name')
-    elapsed_time_str = str(timedelta(seconds=activity_summary.get('elapsed_time', 0)))
-    
-    workout_data = {
-        "activity_type": "Workout",
-        "activity_id": activity_id,
-        "activity_name": activity_name,
-        "date": activity_date,
-        "summary": {
-            "total_time": elapsed_time_str
-        }
-    }
-    
-    return workout_data
+    activity_date = activity_summary.get('start_date', '')[:10]
+    print(f"\n--- Processing Run: '{activity_name}' on {activity_date} ---")
+
+    detailed_activity = detailed_by_id[activity_summary.get('id')]
+
+    # Build Markdown (for easy copy-pasting) and JSON data in one pass
+    markdown_output, run_data = build_run_outputs(detailed_activity, activity_date)
+    print(markdown_output)
+    all_activities_data.append(run_data)
+    print("-" * 40)
 
-def save_activities_to_json(all_activities_data, start_date, end_date):
+def handle_workout(activity_summary, detailed_by_id, all_activities_data):
     """
-    Saves all activities data to a single JSON file in the summary folder.
-    
+    Processes a Workout activity; no detail fetch is needed.
+
     Args:
-        all_activities_data (list): List of activity data dictionaries
-        start_date (datetime): Start date for the period
-        end_date (datetime): End date for the period
-        
-    Returns:
-        bool: True if successful, False otherwise
+        activity_summary (dict): Activity summary data from Strava API
+        detailed_by_id (dict): Prefetched detail responses keyed by activity ID
+        all_activities_data (list): Accumulator for JSON-ready activity data
     """
-    # Create the summary folder if it doesn't exist
-    summary_folder = "summary"
-    os.makedirs(summary_folder, exist_ok=True)
-        
-    # Generate filename based on date range
-    start_str = start_date.strftime('%Y-%m-%d')
-    end_str = end_date.strftime('%Y-%m-%d')
-    
-    if start_str == end_str:
-        filename = f"Activities-{start_str}.json"
-    else:
-        filename = f"Activities-{start_str}-to-{end_str}.json"
-    
-    # Create full path to file in summary folder
-    filepath = os.path.join(summary_folder, filename)
-    
-    json_data = {
-        "period": f"{start_str} to {end_str}",
-        "generated_at": datetime.now().isoformat(),
-        "total_activities": len(all_activities_data),
-        "activities": all_activities_data
-    }
-    
-    try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
-        
-        print(f"\n  -> Successfully saved all activities to '{filepath}'")
-        return True
+    activity_name = activity_summary.get('name')
+    activity_date = activity_summary.get('start_date', '')[:10]
+    print(f"\n--- Processing Workout: '{activity_name}' on {activity_date} ---")
+    elapsed_time = format_hms(activity_summary.get('elapsed_time', 0))
+    print(f"  - Type: Workout")
+    print(f"  - Total Time: {elapsed_time}")
 
-    except Exception as e:
-        print(f"\n  -> Error saving to JSON: {e}")
-        return False
+    all_activities_data.append(prepare_workout_data(activity_summary, activity_date))
+    print("-" * 40)
 
-def get_activities_for_period(start_date=None, end_date=None):
+def handle_skip(activity_summary, detailed_by_id, all_activities_data):
+    """
+    Default handler for activity types that are not processed.
+
+    Args:
+        activity_summary (dict): Activity summary data from Strava API
+        detailed_by_id (dict): Prefetched detail responses keyed by activity ID
+        all_activities_data (list): Accumulator for JSON-ready activity data
+    """
+    activity_name = activity_summary.get('name')
+    activity_date = activity_summary.get('start_date', '')[:10]
+    print(f"\n--- Skipping '{activity_name}' (Type: {activity_summary.get('type')}) on {activity_date} ---")
+    print("-" * 40)
+
+# Dispatch table for the main processing loop; adding a new activity type is
+# a matter of registering its handler here rather than growing an if/elif chain.
+HANDLERS = {
+    "Run": handle_run,
+    "Workout": handle_workout,
+}
+
+def get_activities_for_period(start_date=None, end_date=None, pretty=False, jsonl=None):
     """
     Main function that fetches activities for a specified period or current week,
     prints Markdown to console, and saves all data to JSON.
-    
+
     Args:
-        start_date (datetime, optional): Start date for activity search. 
+        start_date (datetime, optional): Start date for activity search.
                                        Defaults to start of current week.
         end_date (datetime, optional): End date for activity search.
                                      Defaults to current date/time.
+        pretty (bool): Indent the saved JSON file for human inspection.
+        jsonl (bool, optional): Stream activities to a JSON-lines file
+                              instead of one JSON document, keeping memory
+                              flat for long exports. Defaults to automatic
+                              (enabled for ranges longer than 31 days).
     """
     access_token = get_access_token()
     if not access_token:
@@ -279,15 +291,24 @@ def get_activities_for_period(start_date=None, end_date=None):
     print(f"Fetching activities from {start_date.strftime('%Y-%m-%d %H:%M:%S')} to {end_date.strftime('%Y-%m-%d %H:%M:%S')}...")
 
     list_activities_url = "https://www.strava.com/api/v3/athlete/activities"
-    headers = {'Authorization': f'Bearer {access_token}'}
+    # Bind the token to the shared session once so every call this run reuses
+    # it without a per-request header merge
+    SESSION.headers['Authorization'] = f'Bearer {access_token}'
     params = {'before': before_timestamp, 'after': after_timestamp, 'per_page': 200}
 
+    # Long exports default to JSON-lines so peak memory stays flat: each
+    # activity is serialized and flushed as soon as it is processed instead
+    # of being held until one big json.dump at the end.
+    if jsonl is None:
+        jsonl = end_date - start_date > timedelta(days=31)
+
     all_activities_data = []
+    jsonl_fh = None
 
     try:
-        response = requests.get(list_activities_url, headers=headers, params=params)
+        response = SESSION.get(list_activities_url, params=params, timeout=30)
         response.raise_for_status()
-        activities = response.json()
+        activities = parse_json_response(response)
 
         if not activities:
             print("\nNo activities found for the specified period.")
@@ -296,46 +317,55 @@ def get_activities_for_period(start_date=None, end_date=None):
         print(f"\nFound {len(activities)} total activities. Processing...")
         print("-" * 40)
 
+        # Fetch all run details in parallel before the serial processing loop.
+        # The detail calls are network-latency-bound, so fanning them out over
+        # the shared session cuts wall-clock from one round-trip per run to
+        # roughly one round-trip total.
+        runs = [a for a in activities if a.get("type") == "Run"]
+        detailed_by_id = {}
+        if runs:
+            def fetch_run_detail(run):
+                run_id = run["id"]
+                cacheable = is_cache_worthy(run)
+                if cacheable:
+                    cached = load_cached_detail(run_id)
+                    if cached is not None:
+                        return cached
+                detail_url = f"https://www.strava.com/api/v3/activities/{run_id}"
+                detail_response = SESSION.get(detail_url, timeout=30)
+                detail_response.raise_for_status()
+                detailed_activity = parse_json_response(detail_response)
+                if cacheable:
+                    write_cached_detail(run_id, detailed_activity)
+                return detailed_activity
+
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                future_to_id = {executor.submit(fetch_run_detail, run): run["id"] for run in runs}
+                for future in as_completed(future_to_id):
+                    detailed_by_id[future_to_id[future]] = future.result()
+
         for activity_summary in activities:
-            activity_type = activity_summary.get("type")
-            activity_id = activity_summary.get("id")
-            activity_name = activity_summary.get('name')
-            activity_date = datetime.fromisoformat(activity_summary.get('start_date')).strftime('%Y-%m-%d')
-
-            if activity_type == "Run":
-                print(f"\n--- Processing Run: '{activity_name}' on {activity_date} ---")
-                
-                get_activity_url = f"https://www.strava.com/api/v3/activities/{activity_id}"
-                detailed_response = requests.get(get_activity_url, headers=headers)
-                detailed_activity = detailed_response.json()
-
-                # Print Markdown formatted output for easy copy-pasting
-                markdown_output = format_run_for_gemini(detailed_activity)
-                print(markdown_output)
-
-                # Prepare data for JSON
-                run_data = prepare_run_data(detailed_activity)
-                all_activities_data.append(run_data)
-                print("-" * 40)
-
-            elif activity_type == "Workout":
-                print(f"\n--- Processing Workout: '{activity_name}' on {activity_date} ---")
-                elapsed_time = str(timedelta(seconds=activity_summary.get('elapsed_time', 0)))
-                print(f"  - Type: Workout")
-                print(f"  - Total Time: {elapsed_time}")
-                
-                # Prepare data for JSON
-                workout_data = prepare_workout_data(activity_summary)
-                all_activities_data.append(workout_data)
-                print("-" * 40)
+            handler = HANDLERS.get(activity_summary.get("type"), handle_skip)
+            handler(activity_summary, detailed_by_id, all_activities_data)
 
-            else:
-                print(f"\n--- Skipping '{activity_name}' (Type: {activity_type}) on {activity_date} ---")
-                print("-" * 40)
+            # Stream records out as they are produced and drop them from
+            # memory; the output file is only created once there is a record
+            # to write, so all-skipped ranges leave nothing behind
+            if jsonl and all_activities_data:
+                if jsonl_fh is None:
+                    jsonl_fh = open(activities_filepath(start_date, end_date, extension="jsonl"), 'wb', buffering=1 << 20)
+                for record in all_activities_data:
+                    jsonl_fh.write(dump_jsonl_record(record))
+                all_activities_data.clear()
 
         # Save all activities to JSON file
-        if all_activities_data:
-            save_activities_to_json(all_activities_data, start_date, end_date)
+        if jsonl:
+            if jsonl_fh is not None:
+                print(f"\n  -> Successfully saved all activities to '{jsonl_fh.name}'")
+            else:
+                print("\nNo runs or workouts found to save.")
+        elif all_activities_data:
+            save_activities_to_json(all_activities_data, start_date, end_date, pretty=pretty)
         else:
             print("\nNo runs or workouts found to save.")
 
@@ -344,6 +374,10 @@ def get_activities_for_period(start_date=None, end_date=None):
         if e.response:
             print(f"Response Content: {e.response.text}")
 
+    finally:
+        if jsonl_fh is not None:
+            jsonl_fh.close()
+
 def main():
     """
     Main entry point that handles command line arguments for date range.
@@ -352,33 +386,50 @@ def main():
         python get_activities.py                           # Current week (default)
         python get_activities.py 2024-07-01               # From July 1, 2024 to today
         python get_activities.py 2024-07-01 2024-07-31    # From July 1 to July 31, 2024
+
+    Add --pretty to indent the saved JSON file (default output is compact).
+    Add --jsonl to stream activities to a JSON-lines file; this is enabled
+    automatically for date ranges longer than 31 days.
     """
     start_date = None
     end_date = None
-    
-    if len(sys.argv) > 1:
+
+    # Extract flags before positional date arguments
+    flags = {arg for arg in sys.argv[1:] if arg.startswith('--')}
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    unknown_flags = flags - {'--pretty', '--jsonl'}
+    if unknown_flags:
+        print(f"Error: Unknown option(s): {', '.join(sorted(unknown_flags))}")
+        print("Supported options: --pretty, --jsonl")
+        return
+
+    pretty = '--pretty' in flags
+    jsonl = True if '--jsonl' in flags else None
+
+    if len(args) > 0:
         # Parse start date
-        start_date = parse_date_argument(sys.argv[1])
+        start_date = parse_date_argument(args[0])
         if start_date is None:
-            print(f"Error: Invalid start date '{sys.argv[1]}'. Please use YYYY-MM-DD format.")
+            print(f"Error: Invalid start date '{args[0]}'. Please use YYYY-MM-DD format.")
             print("Usage:")
             print("  python get_activities.py                           # Current week")
             print("  python get_activities.py 2024-07-01               # From July 1, 2024 to today")
             print("  python get_activities.py 2024-07-01 2024-07-31    # From July 1 to July 31, 2024")
             return
     
-    if len(sys.argv) > 2:
+    if len(args) > 1:
         # Parse end date
-        end_date = parse_date_argument(sys.argv[2])
+        end_date = parse_date_argument(args[1])
         if end_date is None:
-            print(f"Error: Invalid end date '{sys.argv[2]}'. Please use YYYY-MM-DD format.")
+            print(f"Error: Invalid end date '{args[1]}'. Please use YYYY-MM-DD format.")
             print("Usage:")
             print("  python get_activities.py                           # Current week")
             print("  python get_activities.py 2024-07-01               # From July 1, 2024 to today")
             print("  python get_activities.py 2024-07-01 2024-07-31    # From July 1 to July 31, 2024")
             return
     
-    if len(sys.argv) > 3:
+    if len(args) > 2:
         print("Error: Too many arguments provided.")
         print("Usage:")
         print("  python get_activities.py                           # Current week")
@@ -391,7 +442,7 @@ def main():
         print("Error: Start date cannot be later than end date.")
         return
     
-    get_activities_for_period(start_date, end_date)
+    get_activities_for_period(start_date, end_date, pretty=pretty, jsonl=jsonl)
 
 # Maintain backwards compatibility
 def get_weekly_activities():
@@ -401,4 +452,8 @@ def get_weekly_activities():
     get_activities_for_period()
 
 if __name__ == "__main__":
+    # Surface strava_auth's token status messages on the console, matching
+    # the output this script printed before they moved to logging
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     main()
\ No newline at end of file
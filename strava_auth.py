@@ -28,13 +28,70 @@
 #    c. Exchange the code for tokens using curl or a similar tool
 #
 
+import logging
 import requests
+import sys
 import time
 import os
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Load environment variables from .env file
-load_dotenv()
+# orjson parses JSON noticeably faster than the stdlib module; fall back to
+# stdlib json when the wheel is unavailable.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+# Module logger: callers control verbosity (logging.basicConfig in scripts),
+# and disabled levels cost a single integer comparison instead of a formatted
+# string plus a write syscall.
+logger = logging.getLogger(__name__)
+
+# .env loading is deferred to first use so importing this module costs no
+# disk I/O, and deployments that populate the environment directly (CI,
+# Docker) skip parsing the file entirely.
+_env_loaded = False
+
+def _ensure_env():
+    """Load the .env file on first use unless the env is already populated."""
+    global _env_loaded
+    if not _env_loaded:
+        if not os.getenv('ACCESS_TOKEN'):
+            load_dotenv()
+        _env_loaded = True
+
+# Shared HTTP session so every call to www.strava.com reuses one pooled
+# keep-alive connection instead of paying a TCP+TLS handshake per request.
+# Transient server errors and rate limits are retried with backoff; POST is
+# explicitly allowed so the token refresh benefits too (re-submitting a
+# refresh_token grant is safe).
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST'])
+    )
+))
+
+def get_session():
+    """
+    Returns the shared requests.Session for Strava API calls.
+
+    Downstream modules should reuse this session so all Strava traffic
+    shares the same connection pool.
+
+    Returns:
+        requests.Session: The shared session
+    """
+    return _SESSION
 
 def get_client_credentials():
     """Retrieve client credentials from environment variables."""
@@ -42,106 +99,162 @@ def get_client_credentials():
     client_secret = os.getenv('CLIENT_SECRET')
     
     if not client_id or not client_secret:
-        print("Error: CLIENT_ID and CLIENT_SECRET must be set in the .env file.")
+        logger.error("CLIENT_ID and CLIENT_SECRET must be set in the .env file.")
         return None, None
     
     return client_id, client_secret
 
 def get_stored_tokens():
     """Get stored tokens from environment variables."""
-    access_token = os.getenv('ACCESS_TOKEN')
-    refresh_token = os.getenv('REFRESH_TOKEN')
-    expires_at_str = os.getenv('EXPIRES_AT')
-    
-    if not access_token:
-        print("Error: ACCESS_TOKEN must be set in the .env file.")
-        return None
-        
-    if not refresh_token:
-        print("Error: REFRESH_TOKEN must be set in the .env file.")
-        return None
-        
-    if not expires_at_str:
-        print("Error: EXPIRES_AT must be set in the .env file.")
-        return None
-    
+    env = os.environ
+
+    # Confirm all three variables are present before doing any parsing
+    for name in ('ACCESS_TOKEN', 'REFRESH_TOKEN', 'EXPIRES_AT'):
+        if not env.get(name):
+            logger.error("%s must be set in the .env file.", name)
+            return None
+
     try:
-        expires_at = int(expires_at_str)
+        expires_at = int(env['EXPIRES_AT'])
     except ValueError:
-        print("Error: EXPIRES_AT must be a valid integer timestamp.")
+        logger.error("EXPIRES_AT must be a valid integer timestamp.")
         return None
-    
+
     return {
-        'access_token': access_token,
-        'refresh_token': refresh_token,
+        'access_token': env['ACCESS_TOKEN'],
+        'refresh_token': env['REFRESH_TOKEN'],
         'expires_at': expires_at
     }
 
+def _update_session_env(new_access_token, new_refresh_token, new_expires_at):
+    """Update the environment variables in the current session."""
+    os.environ.update({
+        'ACCESS_TOKEN': new_access_token,
+        'REFRESH_TOKEN': new_refresh_token,
+        'EXPIRES_AT': str(new_expires_at)
+    })
+
 def update_env_file(new_access_token, new_refresh_token, new_expires_at):
-    """Update the .env file with new token values."""
+    """
+    Update the .env file with new token values.
+
+    new_expires_at arrives as an int straight from the token response and is
+    stringified exactly once here.
+    """
+    exp_str = str(new_expires_at)
+
+    # Skip the full .env rewrite when nothing actually changed; the file
+    # already holds these exact values from the previous update.
+    if (new_access_token == os.environ.get('ACCESS_TOKEN')
+            and new_refresh_token == os.environ.get('REFRESH_TOKEN')
+            and exp_str == os.environ.get('EXPIRES_AT')):
+        return
+
     try:
-        # Read current .env file
-        env_lines = []
-        if os.path.exists('.env'):
+        # Read current .env file in one call and split once, keeping the
+        # original line endings so untouched lines pass through by reference.
+        # Opening directly instead of stat-then-open avoids a syscall and the
+        # race between the two.
+        try:
             with open('.env', 'r') as f:
-                env_lines = f.readlines()
+                env_text = f.read()
+        except FileNotFoundError:
+            env_text = ''
+        env_lines = env_text.splitlines(keepends=True)
 
         # Update or add the token values
-        updated_lines = []
         tokens_to_update = {
             'ACCESS_TOKEN': new_access_token,
             'REFRESH_TOKEN': new_refresh_token,
-            'EXPIRES_AT': str(new_expires_at)
+            'EXPIRES_AT': exp_str
         }
 
         # Track which tokens were updated
         updated_tokens = set()
+        updated_lines = []
 
-        # Update existing lines
+        # Single pass: rewrite lines whose key gets a new value and keep
+        # every other line — comments and blanks included — exactly as it was
         for line in env_lines:
-            line = line.strip()
-            if line and not line.startswith('#'):
-                key = line.split('=')[0]
-                if key in tokens_to_update:
+            stripped = line.strip()
+            if stripped and not stripped.startswith('#'):
+                # partition stops at the first '=' without building a list of
+                # every fragment; lines without one are passed through as-is
+                key, sep, _ = stripped.partition('=')
+                if sep and key in tokens_to_update:
                     updated_lines.append(f"{key}={tokens_to_update[key]}\n")
                     updated_tokens.add(key)
-                else:
-                    updated_lines.append(line + '\n')
-            else:
-                updated_lines.append(line + '\n')
-
-        # Add new tokens if they were not updated
-        for key, value in tokens_to_update.items():
-            if key not in updated_tokens:
-                updated_lines.append(f"{key}={value}\n")
-
-        # Write the updated lines back to the .env file
-        with open('.env', 'w') as f:
-            f.writelines(updated_lines)
-
-        # Update the environment variables in the current session
-        os.environ['ACCESS_TOKEN'] = new_access_token
-        os.environ['REFRESH_TOKEN'] = new_refresh_token
-        os.environ['EXPIRES_AT'] = str(new_expires_at)
-
-        print("Tokens successfully updated in .env file.")
+                    continue
+            updated_lines.append(line)
+
+        # Add new tokens if they were not updated, making sure they start
+        # on their own line if the file lacked a trailing newline
+        if len(updated_tokens) < len(tokens_to_update):
+            if updated_lines and not updated_lines[-1].endswith('\n'):
+                updated_lines.append('\n')
+            for key, value in tokens_to_update.items():
+                if key not in updated_tokens:
+                    updated_lines.append(f"{key}={value}\n")
+
+        # Write atomically via a temp file + os.replace: opening .env in 'w'
+        # mode truncates it first, so a crash mid-write would lose the only
+        # copy of the credentials. The swap must not change the file's
+        # permissions either — .env holds secrets and users may have locked
+        # it down — so carry the original mode onto the temp file, defaulting
+        # to owner-only for a brand new file.
+        try:
+            env_mode = os.stat('.env').st_mode & 0o777
+        except FileNotFoundError:
+            env_mode = 0o600
+
+        tmp_path = '.env.tmp'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(''.join(updated_lines))
+        # chmod by path rather than fchmod: os.fchmod does not exist on
+        # Windows, and this module has to keep working there
+        os.chmod(tmp_path, env_mode)
+        os.replace(tmp_path, '.env')
+
+        _update_session_env(new_access_token, new_refresh_token, exp_str)
+
+        logger.info("Tokens successfully updated in .env file.")
     except Exception as e:
-        print(f"Error updating .env file: {e}")
-        print("Tokens updated in current session only.")
+        logger.error("Error updating .env file: %s", e)
+        logger.warning("Tokens updated in current session only.")
         # Still update the environment variables in the current session
-        os.environ['ACCESS_TOKEN'] = new_access_token
-        os.environ['REFRESH_TOKEN'] = new_refresh_token
-        os.environ['EXPIRES_AT'] = str(new_expires_at)
+        _update_session_env(new_access_token, new_refresh_token, exp_str)
+
+# In-process memo of the last known-good token. Repeated get_access_token()
+# calls in one process (e.g. a batch fetcher) become a time comparison and a
+# dict lookup instead of re-reading and re-parsing environment variables.
+# The deadline is kept on the monotonic clock so NTP steps or wall-clock
+# jumps cannot trigger spurious refreshes, and time.monotonic() is a vDSO
+# call on Linux — no syscall on the hot path.
+_TOKEN_CACHE = {'token': None, 'refresh_deadline': 0}
+
+def _cache_token(token, expires_at):
+    """Memoize a known-good token against a monotonic refresh deadline."""
+    _TOKEN_CACHE['token'] = token
+    # Specialize the expiry check: fold the 600s refresh margin into the
+    # deadline now so the hot path is a single comparison with no arithmetic
+    _TOKEN_CACHE['refresh_deadline'] = time.monotonic() + (expires_at - time.time()) - 600
 
 def get_access_token():
     """
     Main function to get a valid access token.
     It retrieves client credentials and stored tokens, checks for expiration,
     and refreshes if needed.
-    
+
     Returns:
         str: Valid access token, or None if authentication fails
     """
+    # Fast path: the cached token is still comfortably within its lifetime
+    if _TOKEN_CACHE['token'] and time.monotonic() < _TOKEN_CACHE['refresh_deadline']:
+        return _TOKEN_CACHE['token']
+
+    _ensure_env()
+
     client_id, client_secret = get_client_credentials()
     if not client_id or not client_secret:
         return None
@@ -152,7 +265,7 @@ def get_access_token():
 
     # Check if the token is expired or will expire in the next 10 minutes
     if tokens['expires_at'] < time.time() + 600:
-        print("Access token expired or is about to expire. Refreshing...")
+        logger.info("Access token expired or is about to expire. Refreshing...")
 
         # Prepare the data for the POST request
         payload = {
@@ -164,10 +277,10 @@ def get_access_token():
 
         # Make the API call to refresh the token
         try:
-            response = requests.post("https://www.strava.com/oauth/token", data=payload)
+            response = _SESSION.post("https://www.strava.com/oauth/token", data=payload, timeout=(3.05, 10))
             response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
 
-            new_tokens = response.json()
+            new_tokens = _loads(response.content)
 
             # Update the .env file with new tokens
             update_env_file(
@@ -176,39 +289,43 @@ def get_access_token():
                 new_tokens['expires_at']
             )
 
-            print("Successfully refreshed the access token.")
+            logger.info("Successfully refreshed the access token.")
+            _cache_token(new_tokens['access_token'], new_tokens['expires_at'])
             return new_tokens['access_token']
 
         except requests.exceptions.RequestException as e:
-            print(f"Error refreshing token: {e}")
-            print("Please check your .env file for correct credentials.")
+            logger.error("Error refreshing token: %s", e)
+            logger.error("Please check your .env file for correct credentials.")
             return None
 
     else:
-        print("Access token is still valid.")
+        logger.info("Access token is still valid.")
+        _cache_token(tokens['access_token'], tokens['expires_at'])
         return tokens['access_token']
 
+def _report_result(access_token):
+    """Print the outcome of an authentication attempt."""
+    # One write call for the whole report instead of one syscall per line
+    if access_token:
+        sys.stdout.write(
+            "\nAuthentication successful!\n"
+            f"Current Access Token: {access_token}\n"
+            "\nYou can now use this token to make requests to the Strava API.\n"
+        )
+    else:
+        sys.stdout.write("\nAuthentication failed. Please review the error messages above.\n")
+    sys.stdout.flush()
+
 def refresh_access_token():
     """
     Legacy function for backwards compatibility.
     Calls get_access_token() and displays results.
     """
-    access_token = get_access_token()
-    if access_token:
-        print("\nAuthentication successful!")
-        print(f"Current Access Token: {access_token}")
-        print("\nYou can now use this token to make requests to the Strava API.")
-    else:
-        print("\nAuthentication failed. Please review the error messages above.")
+    _report_result(get_access_token())
 
 if __name__ == "__main__":
+    # Preserve the old console output when run as a script
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
     print("Attempting to get a valid Strava access token...")
-    
-    access_token = get_access_token()
-    
-    if access_token:
-        print("\nAuthentication successful!")
-        print(f"Current Access Token: {access_token}")
-        print("\nYou can now use this token to make requests to the Strava API.")
-    else:
-        print("\nAuthentication failed. Please review the error messages above.")
\ No newline at end of file
+    _report_result(get_access_token())
\ No newline at end of file
@@ -0,0 +1,268 @@
+# strava_formatters.py
+#
+# Description:
+# Shared formatting and persistence helpers for Strava activity data. These
+# functions turn detailed activity payloads from the Strava API into the
+# Markdown summaries printed to the console and the structured dicts saved
+# to JSON, and write the combined export file. Keeping them in one module
+# gives every entrypoint the same optimized code path.
+#
+# Requirements:
+#   - Python 3
+#   - 'orjson' library (optional, pip install orjson) for faster JSON output
+#
+
+import json
+import os
+from datetime import datetime
+
+# orjson serializes several times faster than the stdlib json module and
+# handles datetime objects natively; fall back to stdlib json if unavailable.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def format_pace(seconds_per_meter: float) -> str:
+    """
+    Converts pace from seconds per meter to a MM:SS/km string.
+
+    Callers are expected to pass a positive pace; the "00:00" fallback for
+    missing or zero speeds lives at the call sites, which already have to
+    check the speed before dividing by it.
+
+    Args:
+        seconds_per_meter (float): Pace in seconds per meter
+
+    Returns:
+        str: Formatted pace string (MM:SS)
+    """
+    # One int conversion and one integer divmod instead of three float ops
+    total_seconds = int(seconds_per_meter * 1000)
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+def format_hms(total_seconds: int) -> str:
+    """
+    Formats a duration in seconds as H:MM:SS. Hours are not wrapped at 24,
+    so a day-long duration renders as "25:00:01" rather than timedelta's
+    "1 day, 1:00:01"; activity durations stay well under that.
+
+    Avoids constructing a timedelta object per call, which matters inside
+    the splits loop.
+
+    Args:
+        total_seconds (int): Duration in seconds
+
+    Returns:
+        str: Formatted duration string (H:MM:SS)
+    """
+    hours, remainder = divmod(int(total_seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+def build_run_outputs(detailed_activity, activity_date=None):
+    """
+    Builds the Markdown summary and the JSON-ready dict for a run in a
+    single pass over the activity data.
+
+    The Markdown string is meant for easy copy-pasting into an AI chat;
+    the dict mirrors it for JSON storage. Producing both from one walk of
+    the splits list avoids recomputing pace, distance and time per split.
+
+    Args:
+        detailed_activity (dict): Detailed activity data from Strava API
+        activity_date (str, optional): Precomputed YYYY-MM-DD date; derived
+                                       from start_date when not provided
+
+    Returns:
+        tuple: (Markdown-formatted activity summary, structured run data
+               for JSON storage)
+    """
+    if activity_date is None:
+        # start_date is ISO-8601 and already begins with YYYY-MM-DD, so
+        # slicing avoids a full parse+format round-trip per activity
+        activity_date = detailed_activity.get('start_date', '')[:10]
+    activity_id = detailed_activity.get('id')
+    activity_name = detailed_activity.get('name')
+
+    # Summary data, shared by both outputs
+    distance_km = detailed_activity.get('distance', 0) / 1000.0
+    moving_time_str = format_hms(detailed_activity.get('moving_time', 0))
+    elapsed_time_str = format_hms(detailed_activity.get('elapsed_time', 0))
+    avg_speed = detailed_activity.get('average_speed', 0)
+    pace = format_pace(1 / avg_speed) if avg_speed else "00:00"
+    calories = int(detailed_activity.get('calories', 0))
+
+    summary_lines = ["### Activity Summary"]
+    summary_lines.append(f"- **Distance**: {distance_km:.2f} km")
+    summary_lines.append(f"- **Moving Time**: {moving_time_str}")
+    summary_lines.append(f"- **Average Pace**: {pace} /km")
+    summary_lines.append(f"- **Calories**: {calories}")
+
+    run_data = {
+        "activity_type": "Run",
+        "activity_id": activity_id,
+        "activity_name": activity_name,
+        "date": activity_date,
+        "summary": {
+            "distance_km": round(distance_km, 2),
+            "moving_time": moving_time_str,
+            "elapsed_time": elapsed_time_str,
+            "average_pace_per_km": pace,
+            "calories": calories
+        },
+        "splits": []
+    }
+
+    # One walk over the splits feeds both the Markdown table and the JSON list
+    splits = detailed_activity.get("splits_metric")
+    if splits:
+        summary_lines.append("\n### Splits Breakdown")
+        summary_lines.append("| Split | Pace (/km) | Distance (km) | Time    | Avg HR | Elev Diff (m) |")
+        summary_lines.append("|-------|------------|---------------|---------|--------|---------------|")
+        for split in splits:
+            # Fetch every field exactly once per split
+            split_num = split.get('split')
+            avg_split_speed = split.get('average_speed')
+            split_pace = format_pace(1 / avg_split_speed) if avg_split_speed else "00:00"
+            split_dist_km = round(split.get('distance', 0) / 1000.0, 2)
+            split_time = format_hms(split.get('moving_time', 0))
+            split_heartrate = split.get('average_heartrate')
+            split_hr = int(split_heartrate) if split_heartrate else None
+            split_elev = round(split.get('elevation_difference', 0), 1)
+
+            # One join over pre-formatted cells instead of a single wide
+            # f-string interpolating every field inline
+            cells = (
+                f"{split_num:<5}",
+                f"{split_pace:<10}",
+                f"{split_dist_km:<13.2f}",
+                f"{split_time:<7}",
+                f"{(split_hr if split_hr is not None else 'N/A'):<6}",
+                f"{split_elev:<13.1f}",
+            )
+            summary_lines.append("| " + " | ".join(cells) + " |")
+            run_data["splits"].append({
+                "split_number": split_num,
+                "pace_per_km": split_pace,
+                "distance_km": split_dist_km,
+                "time": split_time,
+                "avg_heart_rate": split_hr,
+                "elevation_difference_m": split_elev
+            })
+
+    return "\n".join(summary_lines), run_data
+
+def prepare_workout_data(activity_summary, activity_date=None):
+    """
+    Prepares workout data for JSON storage.
+
+    Args:
+        activity_summary (dict): Activity summary data from Strava API
+        activity_date (str, optional): Precomputed YYYY-MM-DD date; derived
+                                       from start_date when not provided
+
+    Returns:
+        dict: Structured workout data for JSON storage
+    """
+    if activity_date is None:
+        activity_date = activity_summary.get('start_date', '')[:10]
+    activity_id = activity_summary.get('id')
+    activity_name = activity_summary.get('name')
+    elapsed_time_str = format_hms(activity_summary.get('elapsed_time', 0))
+
+    workout_data = {
+        "activity_type": "Workout",
+        "activity_id": activity_id,
+        "activity_name": activity_name,
+        "date": activity_date,
+        "summary": {
+            "total_time": elapsed_time_str
+        }
+    }
+
+    return workout_data
+
+def activities_filepath(start_date, end_date, extension="json"):
+    """
+    Builds the output file path for a date range, creating the summary folder.
+
+    Args:
+        start_date (datetime): Start date for the period
+        end_date (datetime): End date for the period
+        extension (str): File extension without the dot
+
+    Returns:
+        str: Path to the output file inside the summary folder
+    """
+    summary_folder = "summary"
+    os.makedirs(summary_folder, exist_ok=True)
+
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+
+    if start_str == end_str:
+        filename = f"Activities-{start_str}.{extension}"
+    else:
+        filename = f"Activities-{start_str}-to-{end_str}.{extension}"
+
+    return os.path.join(summary_folder, filename)
+
+def dump_jsonl_record(record):
+    """
+    Serializes one activity record as a newline-terminated JSON line.
+
+    Args:
+        record (dict): Activity data dictionary
+
+    Returns:
+        bytes: Compact JSON encoding of the record plus a trailing newline
+    """
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n").encode('utf-8')
+
+def save_activities_to_json(all_activities_data, start_date, end_date, pretty=False):
+    """
+    Saves all activities data to a single JSON file in the summary folder.
+
+    Args:
+        all_activities_data (list): List of activity data dictionaries
+        start_date (datetime): Start date for the period
+        end_date (datetime): End date for the period
+        pretty (bool): Indent the JSON output for human inspection.
+                       Defaults to compact output, which is smaller and
+                       faster to write.
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    filepath = activities_filepath(start_date, end_date)
+
+    start_str = start_date.strftime('%Y-%m-%d')
+    end_str = end_date.strftime('%Y-%m-%d')
+    json_data = {
+        "period": f"{start_str} to {end_str}",
+        "generated_at": datetime.now(),
+        "total_activities": len(all_activities_data),
+        "activities": all_activities_data
+    }
+
+    try:
+        if orjson is not None:
+            # orjson emits RFC 3339 for datetime objects natively
+            with open(filepath, 'wb', buffering=1 << 20) as f:
+                f.write(orjson.dumps(json_data, option=orjson.OPT_INDENT_2 if pretty else 0))
+        else:
+            json_data["generated_at"] = json_data["generated_at"].isoformat()
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(json_data, f, indent=2 if pretty else None,
+                          separators=None if pretty else (',', ':'), ensure_ascii=False)
+
+        print(f"\n  -> Successfully saved all activities to '{filepath}'")
+        return True
+
+    except Exception as e:
+        print(f"\n  -> Error saving to JSON: {e}")
+        return False